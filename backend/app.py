@@ -1,13 +1,21 @@
+import hashlib
+import io
 import json
 import os
+import time
 import traceback
-from flask import Flask, request, jsonify, send_from_directory, render_template
+from collections import Counter
+from flask import Flask, request, jsonify, send_from_directory, render_template, Response
 from werkzeug.utils import secure_filename
 from flask_cors import CORS
 
 from converter.parser import MakeComParser
 from converter.mapper import MakeComToN8nMapper
 from converter.generator import N8nWorkflowGenerator
+from converter.bundle import WorkflowBundle
+from compression import negotiate_encoding, compress_chunks
+from result_cache import ResultCache
+from history import ConversionHistory
 
 app = Flask(__name__,
             static_folder=os.path.join(os.path.dirname(os.path.abspath(__file__)), '../frontend'),
@@ -20,6 +28,9 @@ CORS(app)
 UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads')
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024 # 16 MB limit
+app.config['COMPRESSION_MIN_SIZE'] = 1024 # Smaller responses are sent uncompressed
+app.config['RESULT_CACHE_SIZE'] = 32 # Number of converted workflows kept in memory
+app.config['HISTORY_DB'] = os.environ.get('CONVERSION_HISTORY_DB') # SQLite path; history is off when unset
 
 # Ensure upload folder exists
 if not os.path.exists(app.config['UPLOAD_FOLDER']):
@@ -35,6 +46,38 @@ except FileNotFoundError:
     MODULE_MAPPINGS = {}
     print(f"Warning: {mappings_path} not found. Using empty mappings.")
 
+# Identifies the mapping set a conversion ran against
+MAPPING_VERSION = hashlib.sha256(json.dumps(MODULE_MAPPINGS, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+RESULT_CACHE = ResultCache(app.config['RESULT_CACHE_SIZE'])
+HISTORY = ConversionHistory(app.config['HISTORY_DB']) if app.config['HISTORY_DB'] else None
+
+def _workflow_response(cache_key, body):
+    """
+    Sends a serialized conversion result, compressed according to the client's
+    Accept-Encoding. Compressed bodies are streamed and then stored in the result
+    cache next to the plain body, so repeat downloads skip recompression.
+    """
+    encoding = negotiate_encoding(request.headers.get('Accept-Encoding', ''), len(body),
+                                  app.config['COMPRESSION_MIN_SIZE'])
+    if encoding is None:
+        response = Response(body, mimetype='application/json')
+    else:
+        cached = RESULT_CACHE.get(cache_key, encoding)
+        if cached is not None:
+            response = Response(cached, mimetype='application/json')
+        else:
+            def stream():
+                chunks = []
+                for chunk in compress_chunks(body, encoding):
+                    chunks.append(chunk)
+                    yield chunk
+                RESULT_CACHE.put(cache_key, b"".join(chunks), encoding)
+            response = Response(stream(), mimetype='application/json')
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -55,30 +98,72 @@ def convert_workflow():
         file.save(filepath)
 
         try:
-            with open(filepath, 'r') as f:
-                make_json = json.load(f)
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+
+            # Compact output drops fields n8n fills in with defaults on import
+            compact = request.values.get('compact', '').lower() in ('1', 'true', 'yes')
+            profile = N8nWorkflowGenerator.COMPACT if compact else N8nWorkflowGenerator.FULL
+
+            # Identical uploads are served from the result cache
+            input_hash = ResultCache.key_for(raw)
+            cache_key = f"{input_hash}:{profile}"
+            body = RESULT_CACHE.get(cache_key)
+            if body is not None:
+                os.remove(filepath)
+                return _workflow_response(cache_key, body)
+
+            timings = {}
+            started = time.perf_counter()
+            make_json = json.loads(raw)
+            timings["decode"] = (time.perf_counter() - started) * 1000
             
             # Parse Make.com JSON
+            started = time.perf_counter()
             parser = MakeComParser(make_json)
             parsed_data = parser.parse()
+            timings["parse"] = (time.perf_counter() - started) * 1000
             
             # Map to n8n format
+            started = time.perf_counter()
             mapper = MakeComToN8nMapper(MODULE_MAPPINGS)
             mapped_data = mapper.map_workflow(parsed_data["modules"])
+            timings["map"] = (time.perf_counter() - started) * 1000
 
             # Generate n8n workflow
+            started = time.perf_counter()
             workflow_name = make_json.get("name", "Converted Workflow")
-            generator = N8nWorkflowGenerator(mapped_data["nodes"], mapped_data["connections"], workflow_name)
+            generator = N8nWorkflowGenerator(mapped_data["nodes"], mapped_data["connections"], workflow_name, profile)
             n8n_workflow = generator.generate_workflow()
+            timings["generate"] = (time.perf_counter() - started) * 1000
 
             # Clean up uploaded file
             os.remove(filepath)
 
-            return jsonify({
+            result = {
                 "success": True,
                 "n8n_workflow": n8n_workflow,
                 "warnings": mapped_data["warnings"]
-            })
+            }
+            if compact:
+                body = json.dumps(result, separators=(",", ":"), ensure_ascii=False).encode('utf-8')
+            else:
+                body = app.json.dumps(result).encode('utf-8')
+            RESULT_CACHE.put(cache_key, body)
+
+            if HISTORY is not None:
+                HISTORY.record(
+                    input_hash=input_hash,
+                    mapping_version=MAPPING_VERSION,
+                    workflow_name=workflow_name,
+                    module_counts=Counter(module.get("module") for module in parsed_data["modules"]),
+                    unmapped_types={w["module_type"] for w in mapped_data["warnings"] if w["kind"] == "unmapped_module"},
+                    node_count=len(n8n_workflow["nodes"]),
+                    stage_timings=timings,
+                    output=body
+                )
+
+            return _workflow_response(cache_key, body)
 
         except json.JSONDecodeError:
             if os.path.exists(filepath):
@@ -110,6 +195,71 @@ def convert_workflow():
             "error": "Invalid file type. Please upload a JSON file."
         }), 400
 
+@app.route('/convert/bundle', methods=['POST'])
+def convert_bundle():
+    """
+    Converts several uploaded blueprints into one n8n import file: a JSON array
+    by default, or a zip archive with one workflow per file when format=zip.
+    """
+    files = [f for f in request.files.getlist('files') if f.filename]
+    if not files:
+        return jsonify({"success": False, "error": "No files uploaded"}), 400
+
+    compact = request.values.get('compact', '').lower() in ('1', 'true', 'yes')
+    profile = N8nWorkflowGenerator.COMPACT if compact else N8nWorkflowGenerator.FULL
+    bundle = WorkflowBundle(MODULE_MAPPINGS, profile)
+    blueprints = ((secure_filename(f.filename), json.load(f.stream)) for f in files)
+
+    try:
+        if request.values.get('format') == 'zip':
+            output = io.BytesIO()
+            bundle.write_archive(output, blueprints)
+            return Response(output.getvalue(), mimetype='application/zip',
+                            headers={'Content-Disposition': 'attachment; filename=n8n-workflows.zip'})
+
+        output = io.StringIO()
+        bundle.write_array(output, blueprints)
+        return Response(output.getvalue(), mimetype='application/json',
+                        headers={'Content-Disposition': 'attachment; filename=n8n-workflows.json'})
+    except json.JSONDecodeError as e:
+        return jsonify({
+            "success": False,
+            "error": f"Invalid JSON file: {str(e)}"
+        }), 400
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": f"Conversion failed: {str(e)}",
+            "stack": traceback.format_exc()
+        }), 500
+
+def _history_limit():
+    return max(1, min(request.args.get('limit', 20, type=int), 500))
+
+@app.route('/history/recent', methods=['GET'])
+def history_recent():
+    if HISTORY is None:
+        return jsonify({"error": "Conversion history is disabled. Set CONVERSION_HISTORY_DB to enable it."}), 404
+    return jsonify({"conversions": HISTORY.recent(_history_limit())})
+
+@app.route('/history/slowest', methods=['GET'])
+def history_slowest():
+    if HISTORY is None:
+        return jsonify({"error": "Conversion history is disabled. Set CONVERSION_HISTORY_DB to enable it."}), 404
+    return jsonify({"conversions": HISTORY.slowest(_history_limit())})
+
+@app.route('/history/module/<path:module_type>', methods=['GET'])
+def history_by_module(module_type):
+    if HISTORY is None:
+        return jsonify({"error": "Conversion history is disabled. Set CONVERSION_HISTORY_DB to enable it."}), 404
+    return jsonify({"conversions": HISTORY.by_module_type(module_type, _history_limit())})
+
+@app.route('/history/hash/<input_hash>', methods=['GET'])
+def history_by_hash(input_hash):
+    if HISTORY is None:
+        return jsonify({"error": "Conversion history is disabled. Set CONVERSION_HISTORY_DB to enable it."}), 404
+    return jsonify({"conversions": HISTORY.by_hash(input_hash)})
+
 # Route to serve static files from the frontend directory
 @app.route('/<path:path>')
 def serve_static(path):
@@ -0,0 +1,99 @@
+import argparse
+import json
+import os
+import sys
+
+from converter.bundle import WorkflowBundle
+from converter.generator import N8nWorkflowGenerator
+
+DEFAULT_MAPPINGS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mappings', 'generic_module_mappings.json')
+
+def load_mappings(path: str):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"Warning: {path} not found. Using empty mappings.", file=sys.stderr)
+        return {}
+
+def iter_blueprint_paths(paths: list):
+    """
+    Expands files and directories into blueprint file paths.
+    Directories contribute their *.json files in name order.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith('.json'):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+
+def iter_blueprints(paths: list):
+    """
+    Yields (file name, parsed blueprint) pairs, loading one file at a time.
+    """
+    for path in iter_blueprint_paths(paths):
+        with open(path, 'r') as f:
+            yield os.path.basename(path), json.load(f)
+
+def _profile(args):
+    return N8nWorkflowGenerator.COMPACT if args.compact else N8nWorkflowGenerator.FULL
+
+def cmd_convert(args):
+    bundle = WorkflowBundle(load_mappings(args.mappings), _profile(args))
+    for name, make_json in iter_blueprints([args.input]):
+        n8n_workflow, warnings = bundle.convert(make_json, name)
+        if args.compact:
+            output = json.dumps(n8n_workflow, separators=(",", ":"), ensure_ascii=False)
+        else:
+            output = json.dumps(n8n_workflow, indent=2, ensure_ascii=False)
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(output)
+        else:
+            print(output)
+        for warning in warnings:
+            print(f"warning: {json.dumps(warning)}", file=sys.stderr)
+    return 0
+
+def cmd_bundle(args):
+    bundle = WorkflowBundle(load_mappings(args.mappings), _profile(args))
+    blueprints = iter_blueprints(args.inputs)
+    if args.zip:
+        with open(args.output, 'wb') as f:
+            bundle.write_archive(f, blueprints)
+    else:
+        with open(args.output, 'w') as f:
+            bundle.write_array(f, blueprints)
+
+    for report in bundle.reports:
+        print(f"{report['source']}: {report['nodes']} nodes, {len(report['warnings'])} warnings", file=sys.stderr)
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Convert Make.com blueprints to n8n workflows.")
+    parser.add_argument('--mappings', default=DEFAULT_MAPPINGS_PATH, help="Path to the module mappings JSON file")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    convert_parser = subparsers.add_parser('convert', help="Convert a single blueprint")
+    convert_parser.add_argument('input', help="Make.com blueprint JSON file")
+    convert_parser.add_argument('-o', '--output', help="Output file (defaults to stdout)")
+    convert_parser.add_argument('--compact', action='store_true', help="Omit fields n8n fills in on import")
+    convert_parser.set_defaults(func=cmd_convert)
+
+    bundle_parser = subparsers.add_parser('bundle', help="Convert many blueprints into one n8n import file")
+    bundle_parser.add_argument('inputs', nargs='+', help="Blueprint files or directories of blueprints")
+    bundle_parser.add_argument('-o', '--output', required=True, help="Output file")
+    bundle_parser.add_argument('--zip', action='store_true', help="Write a zip archive instead of a JSON array")
+    bundle_parser.add_argument('--compact', action='store_true', help="Omit fields n8n fills in on import")
+    bundle_parser.set_defaults(func=cmd_bundle)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+if __name__ == '__main__':
+    sys.exit(main())
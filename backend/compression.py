@@ -0,0 +1,100 @@
+import zlib
+
+# Optional encoders; gzip is always available through zlib
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+CHUNK_SIZE = 64 * 1024
+MIN_COMPRESS_SIZE = 1024
+
+# Server preference when the client accepts several encodings with the same q-value
+PREFERRED_ENCODINGS = ["zstd", "br", "gzip"]
+
+
+def available_encodings():
+    """
+    Returns the content encodings this process can produce, in preference order.
+    """
+    available = {"gzip"}
+    if brotli is not None:
+        available.add("br")
+    if zstandard is not None:
+        available.add("zstd")
+    return [encoding for encoding in PREFERRED_ENCODINGS if encoding in available]
+
+
+def negotiate_encoding(accept_encoding: str, size: int, min_size: int = MIN_COMPRESS_SIZE):
+    """
+    Picks a content encoding from an Accept-Encoding header value.
+    Returns None when the body is below `min_size` or nothing acceptable is available.
+    """
+    if not accept_encoding or size < min_size:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+
+    wildcard = accepted.get("*", 0.0)
+    candidates = [
+        (accepted.get(encoding, wildcard), -rank, encoding)
+        for rank, encoding in enumerate(available_encodings())
+    ]
+    q, _, encoding = max(candidates)
+    return encoding if q > 0 else None
+
+
+class _BrotliCompressor:
+    """
+    Adapts brotli.Compressor to the compress()/flush() interface of zlib.
+    """
+
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=5)
+
+    def compress(self, data):
+        return self._compressor.process(bytes(data))
+
+    def flush(self):
+        return self._compressor.finish()
+
+
+def _make_compressor(encoding: str):
+    if encoding == "gzip":
+        return zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31 writes a gzip header
+    if encoding == "br":
+        return _BrotliCompressor()
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compressobj()
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def compress_chunks(data: bytes, encoding: str, chunk_size: int = CHUNK_SIZE):
+    """
+    Compresses `data` incrementally, yielding compressed chunks as they are produced,
+    so a response can start streaming before the whole body is compressed.
+    """
+    compressor = _make_compressor(encoding)
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        chunk = compressor.compress(view[start:start + chunk_size])
+        if chunk:
+            yield chunk
+    tail = compressor.flush()
+    if tail:
+        yield tail
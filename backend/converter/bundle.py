@@ -0,0 +1,83 @@
+import json
+import zipfile
+from .parser import MakeComParser
+from .mapper import MakeComToN8nMapper
+from .resolver import MappingResolver
+from .generator import N8nWorkflowGenerator
+
+class WorkflowBundle:
+    """
+    Converts many Make.com blueprints into a single n8n import artifact.
+    The mapping resolver and the expression cache are built once per bundle
+    and shared by every workflow in it, so identical module types and
+    expressions across scenarios are only resolved/converted once.
+    """
+
+    def __init__(self, mappings: dict, profile: str = N8nWorkflowGenerator.FULL):
+        self.mappings = mappings
+        self.profile = profile
+        self.resolver = MappingResolver(mappings)
+        self.expression_cache = {}
+        self.reports = []
+
+    def convert(self, make_json: dict, source_name: str = None):
+        """
+        Converts one blueprint using the bundle's shared state.
+        Returns (n8n_workflow, warnings).
+        """
+        parsed_data = MakeComParser(make_json).parse()
+
+        mapper = MakeComToN8nMapper(self.mappings, resolver=self.resolver, expression_cache=self.expression_cache)
+        mapped_data = mapper.map_workflow(parsed_data["modules"])
+
+        workflow_name = make_json.get("name", source_name or "Converted Workflow")
+        generator = N8nWorkflowGenerator(mapped_data["nodes"], mapped_data["connections"], workflow_name, self.profile)
+        n8n_workflow = generator.generate_workflow()
+
+        self.reports.append({
+            "source": source_name or workflow_name,
+            "name": workflow_name,
+            "nodes": len(mapped_data["nodes"]),
+            "warnings": mapped_data["warnings"]
+        })
+        return n8n_workflow, mapped_data["warnings"]
+
+    def write_array(self, fp, blueprints):
+        """
+        Streams the converted workflows into `fp` as one JSON array, which
+        `n8n import:workflow --input=<file>` accepts. `blueprints` is an iterable
+        of (source_name, make_json) pairs; each workflow is written and released
+        before the next one is converted.
+        """
+        separators = (",", ":") if self.profile == N8nWorkflowGenerator.COMPACT else None
+        fp.write("[")
+        for i, (source_name, make_json) in enumerate(blueprints):
+            n8n_workflow, _ = self.convert(make_json, source_name)
+            if i:
+                fp.write(",")
+            json.dump(n8n_workflow, fp, separators=separators, ensure_ascii=False)
+        fp.write("]")
+
+    def write_archive(self, fp, blueprints):
+        """
+        Streams the converted workflows into a zip archive written to the binary
+        file object `fp`, one `<source_name>.json` entry per workflow.
+        """
+        separators = (",", ":") if self.profile == N8nWorkflowGenerator.COMPACT else None
+        used_names = set()
+        with zipfile.ZipFile(fp, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for source_name, make_json in blueprints:
+                n8n_workflow, _ = self.convert(make_json, source_name)
+                entry_name = self._entry_name(source_name or n8n_workflow["name"], used_names)
+                archive.writestr(entry_name, json.dumps(n8n_workflow, separators=separators, ensure_ascii=False))
+
+    @staticmethod
+    def _entry_name(source_name: str, used_names: set):
+        base = source_name[:-5] if source_name.endswith(".json") else source_name
+        entry_name = f"{base}.json"
+        counter = 1
+        while entry_name in used_names:
+            entry_name = f"{base}-{counter}.json"
+            counter += 1
+        used_names.add(entry_name)
+        return entry_name
@@ -0,0 +1,54 @@
+class ConnectionTable:
+    """
+    Collects connections between n8n nodes and stores them directly in the
+    shape n8n expects:
+    {
+      "Source Node Name": {
+        "main": [
+          [ {"node": "Target Node Name", "type": "main", "index": 0} ],  # output 0
+          [ ... ]                                                        # output 1
+        ]
+      }
+    }
+    Callers refer to nodes by their stable node IDs; `node_names` translates
+    them to display names as edges are added, so no formatting pass is needed.
+    """
+
+    def __init__(self, node_names: dict):
+        self.node_names = node_names
+        self.connections = {}
+        self.edges = []  # (source_id, output_index, target_id), in insertion order
+        self._seen = set()
+
+    def preallocate(self, source_id: str, output_count: int, type: str = "main"):
+        """
+        Reserves `output_count` outputs for a node up front, e.g. one per router route.
+        """
+        outputs = self._outputs(source_id, type)
+        if len(outputs) < output_count:
+            outputs.extend([] for _ in range(output_count - len(outputs)))
+
+    def add(self, source_id: str, target_id: str, output_index: int = 0, type: str = "main"):
+        """
+        Adds an edge from an output of the source node to the target node.
+        Returns False if the same edge was already present.
+        """
+        key = (source_id, type, output_index, target_id)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        self.edges.append((source_id, output_index, target_id))
+
+        outputs = self._outputs(source_id, type)
+        if len(outputs) <= output_index:
+            outputs.extend([] for _ in range(output_index + 1 - len(outputs)))
+        outputs[output_index].append({
+            "node": self.node_names[target_id],
+            "type": "main", # Assuming 'main' connection type for now
+            "index": 0 # Assuming first input for now
+        })
+        return True
+
+    def _outputs(self, source_id: str, type: str):
+        source = self.connections.setdefault(self.node_names[source_id], {})
+        return source.setdefault(type, [])
@@ -0,0 +1,69 @@
+class DiagnosticsCollector:
+    """
+    Collects conversion warnings as structured records instead of prose.
+    Repeated occurrences of the same (kind, module type, expression) are folded
+    into one record with a count, and only a bounded sample of module IDs is
+    kept per record, so the warning payload stays small for huge scenarios.
+    """
+
+    UNMAPPED_MODULE = "unmapped_module"
+    UNCONVERTIBLE_EXPRESSION = "unconvertible_expression"
+
+    MAX_MODULE_SAMPLES = 5
+    MAX_RECORDS = 100
+    MAX_NOTE_LINES = 50
+
+    def __init__(self):
+        self._records = {}  # insertion ordered, keyed by (kind, module_type, expression)
+
+    def add(self, kind: str, module_type: str = None, expression: str = None, module_id=None):
+        """
+        Records one occurrence of a diagnostic.
+        """
+        key = (kind, module_type, expression)
+        record = self._records.get(key)
+        if record is None:
+            record = self._records[key] = {
+                "kind": kind,
+                "module_type": module_type,
+                "expression": expression,
+                "count": 0,
+                "modules": []
+            }
+        record["count"] += 1
+        if module_id is not None and len(record["modules"]) < self.MAX_MODULE_SAMPLES:
+            record["modules"].append(module_id)
+
+    def has(self, kind: str):
+        return any(key[0] == kind for key in self._records)
+
+    def records(self, kind: str = None):
+        """
+        Returns the compact warning records, omitting empty fields.
+        At most MAX_RECORDS are returned; the remainder is summarised in a
+        final "truncated" record.
+        """
+        records = [r for r in self._records.values() if kind is None or r["kind"] == kind]
+        compact = [
+            {key: value for key, value in record.items() if value not in (None, [])}
+            for record in records[:self.MAX_RECORDS]
+        ]
+        if len(records) > self.MAX_RECORDS:
+            compact.append({"kind": "truncated", "count": len(records) - self.MAX_RECORDS})
+        return compact
+
+    def render_note(self, kind: str, header: str):
+        """
+        Renders the records of one kind as a markdown list for a sticky note,
+        built with a single join.
+        """
+        records = [r for r in self._records.values() if r["kind"] == kind]
+        lines = [
+            f"- {{{{{r['expression']}}}}}"
+            + (f" in {r['module_type']}" if r["module_type"] else "")
+            + (f" ({r['count']}x)" if r["count"] > 1 else "")
+            for r in records[:self.MAX_NOTE_LINES]
+        ]
+        if len(records) > self.MAX_NOTE_LINES:
+            lines.append(f"- ... and {len(records) - self.MAX_NOTE_LINES} more")
+        return header + "\n".join(lines) + "\n"
@@ -3,98 +3,86 @@ import uuid
 import datetime
 
 class N8nWorkflowGenerator:
-    def __init__(self, nodes: list, connections: dict, workflow_name: str = "Converted Workflow"):
+    FULL = "full"
+    COMPACT = "compact"
+
+    # Fields that are the same for every converted workflow. They are built once and
+    # shared between generated workflows, so callers must not mutate them in place.
+    _FULL_SKELETON = {
+        "active": False, # Default to inactive
+        "settings": {
+            "executionOrder": "v1", # Default execution order
+            "saveManualExecutions": True,
+            "callerPolicy": "any",
+            "saveDataErrorExecution": "all"
+        },
+        "tags": ["converted", "make.com"],
+        "pinData": {},
+        "staticData": None,
+        "triggerCount": 0,
+        "description": "This workflow was automatically converted from a Make.com workflow. Some manual adjustments may be required."
+    }
+
+    # Compact profile: everything n8n fills in with the same value on import is left out.
+    # executionOrder and callerPolicy differ from n8n's import defaults, so they stay.
+    # Node typeVersion stays too, since n8n resolves a missing version to the latest one.
+    _COMPACT_SKELETON = {
+        "settings": {
+            "executionOrder": "v1",
+            "callerPolicy": "any"
+        },
+        "tags": ["converted", "make.com"]
+    }
+
+    def __init__(self, nodes: list, connections: dict, workflow_name: str = "Converted Workflow", profile: str = FULL):
+        """
+        `connections` must already be in n8n's final shape, as produced by
+        MakeComToN8nMapper's ConnectionTable.
+        """
+        if profile not in (self.FULL, self.COMPACT):
+            raise ValueError(f"Unknown output profile: {profile}")
         self.nodes = nodes
         self.connections = connections
         self.workflow_name = workflow_name
+        self.profile = profile
 
     def generate_workflow(self):
         """
         Generates the final n8n workflow JSON structure.
         """
-        # Generate unique identifiers
-        workflow_id = str(uuid.uuid4())
-        version_id = str(uuid.uuid4())
-        instance_id = str(uuid.uuid4())
-        
         # Current timestamp for metadata
         current_time = datetime.datetime.utcnow().isoformat()
 
-        n8n_workflow = {
-            "id": workflow_id,
-            "name": self.workflow_name,
-            "nodes": self.nodes,
-            "connections": self._format_connections(),
-            "active": False, # Default to inactive
-            "settings": {
-                "executionOrder": "v1", # Default execution order
-                "saveManualExecutions": True,
-                "callerPolicy": "any",
-                "saveDataErrorExecution": "all"
-            },
-            "versionId": version_id,
-            "meta": {
-                "instanceId": instance_id,
+        if self.profile == self.COMPACT:
+            n8n_workflow = dict(self._COMPACT_SKELETON)
+            n8n_workflow["meta"] = {
+                "convertedFromMakeCom": True,
+                "conversionDate": current_time
+            }
+        else:
+            n8n_workflow = dict(self._FULL_SKELETON)
+            n8n_workflow["id"] = str(uuid.uuid4())
+            n8n_workflow["versionId"] = str(uuid.uuid4())
+            n8n_workflow["meta"] = {
+                "instanceId": str(uuid.uuid4()),
                 "templateCredsSetupCompleted": True,
                 "convertedFromMakeCom": True,
                 "conversionDate": current_time
-            },
-            "tags": ["converted", "make.com"],
-            "pinData": {},
-            "staticData": null,
-            "triggerCount": 0,
-            "updatedAt": current_time,
-            "createdAt": current_time,
-            "description": "This workflow was automatically converted from a Make.com workflow. Some manual adjustments may be required."
-        }
-        
+            }
+            n8n_workflow["updatedAt"] = current_time
+            n8n_workflow["createdAt"] = current_time
+
+        n8n_workflow["name"] = self.workflow_name
+        n8n_workflow["nodes"] = self.nodes
+        n8n_workflow["connections"] = self.connections
+
         return n8n_workflow
-    
-    def _format_connections(self):
+
+    def to_json(self, n8n_workflow: dict):
         """
-        Format connections into valid n8n format.
-        n8n expects connections in a format like:
-        {
-          "Node_Name": {
-            "main": [
-              [
-                {
-                  "node": "Target_Node_Name",
-                  "type": "main",
-                  "index": 0
-                }
-              ]
-            ]
-          }
-        }
+        Serializes a generated workflow. The compact profile uses minimal separators;
+        the full profile is indented for readability.
         """
-        formatted_connections = {}
-        
-        # First check if connections is already in the right format
-        # (when MakeComToN8nMapper._format_connections was called)
-        if self.connections and all(isinstance(v, dict) for v in self.connections.values()):
-            return self.connections
-        
-        # Otherwise, format it correctly
-        for source_node_id, targets in self.connections.items():
-            formatted_connections[source_node_id] = {
-                "main": []
-            }
-            
-            # n8n expects an array of arrays for outputs
-            main_outputs = []
-            
-            # If we have a list of targets, they go in the first output index
-            if isinstance(targets, list):
-                output_targets = []
-                for target in targets:
-                    output_targets.append({
-                        "node": target["node"],
-                        "type": "main",
-                        "index": target.get("index", 0)
-                    })
-                main_outputs.append(output_targets)
-            
-            formatted_connections[source_node_id]["main"] = main_outputs
-            
-        return formatted_connections
\ No newline at end of file
+        if self.profile == self.COMPACT:
+            return json.dumps(n8n_workflow, separators=(",", ":"), ensure_ascii=False)
+        return json.dumps(n8n_workflow, indent=2, ensure_ascii=False)
@@ -0,0 +1,114 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; fall back to plain Python arithmetic
+    np = None
+
+
+class LayoutEngine:
+    """
+    Computes n8n canvas positions for a whole workflow graph at once.
+    Nodes are placed in columns by topological depth (longest path from a root),
+    and within a column ordered by their parent's lane and the router output
+    they hang off, so router branches fan out into separate lanes.
+    """
+
+    ORIGIN_X = 250
+    ORIGIN_Y = 300
+    X_SPACING = 250
+    Y_SPACING = 150
+
+    def layout(self, node_count: int, edges: list):
+        """
+        Lays out `node_count` nodes given `edges` as (source, output_index, target)
+        tuples of node indices.
+        Returns (positions, bounds) where positions is a list of [x, y] per node
+        and bounds is (min_x, min_y, max_x, max_y), or None for an empty graph.
+        """
+        if node_count == 0:
+            return [], None
+
+        depths, ranks, layer_sizes = self._assign_layers(node_count, edges)
+
+        if np is not None:
+            return self._positions_numpy(depths, ranks, layer_sizes)
+        return self._positions_python(depths, ranks, layer_sizes)
+
+    def _assign_layers(self, node_count: int, edges: list):
+        """
+        Assigns each node a depth (column) and a rank (row within the column).
+        """
+        children = [[] for _ in range(node_count)]
+        in_degree = [0] * node_count
+        for source, output_index, target in edges:
+            if source == target:
+                continue
+            children[source].append((output_index, target))
+            in_degree[target] += 1
+
+        # Longest-path layering with Kahn's algorithm
+        depths = [0] * node_count
+        parent = [None] * node_count
+        queued = [degree == 0 for degree in in_degree]
+        queue = [i for i in range(node_count) if queued[i]]
+        head = 0
+        next_unqueued = 0
+        while len(queue) < node_count or head < len(queue):
+            if head == len(queue):
+                # Only cycles are left; release the first node that is still waiting
+                while queued[next_unqueued]:
+                    next_unqueued += 1
+                queued[next_unqueued] = True
+                queue.append(next_unqueued)
+            node = queue[head]
+            head += 1
+            for output_index, target in children[node]:
+                if queued[target]:
+                    continue
+                if depths[node] + 1 > depths[target] or parent[target] is None:
+                    depths[target] = max(depths[target], depths[node] + 1)
+                    parent[target] = (node, output_index)
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    queued[target] = True
+                    queue.append(target)
+
+        # Rank nodes column by column, so a parent's rank is known before its children's
+        layers = {}
+        for node in range(node_count):
+            layers.setdefault(depths[node], []).append(node)
+
+        ranks = [0] * node_count
+        for depth in sorted(layers):
+            layer = layers[depth]
+            layer.sort(key=lambda n: (ranks[parent[n][0]], parent[n][1], n) if parent[n] else (-1, 0, n))
+            for rank, node in enumerate(layer):
+                ranks[node] = rank
+
+        layer_sizes = [len(layers[d]) for d in depths]
+        return depths, ranks, layer_sizes
+
+    def _positions_numpy(self, depths: list, ranks: list, layer_sizes: list):
+        depths = np.asarray(depths, dtype=np.int64)
+        ranks = np.asarray(ranks, dtype=np.float64)
+        layer_sizes = np.asarray(layer_sizes, dtype=np.float64)
+
+        xs = self.ORIGIN_X + depths * self.X_SPACING
+        # Center each column vertically around the origin
+        ys = self.ORIGIN_Y + (ranks - (layer_sizes - 1) / 2) * self.Y_SPACING
+        xs = xs.astype(np.int64)
+        ys = np.rint(ys).astype(np.int64)
+
+        bounds = (int(xs.min()), int(ys.min()), int(xs.max()), int(ys.max()))
+        return np.column_stack((xs, ys)).tolist(), bounds
+
+    def _positions_python(self, depths: list, ranks: list, layer_sizes: list):
+        positions = []
+        min_x = min_y = float("inf")
+        max_x = max_y = float("-inf")
+        for depth, rank, size in zip(depths, ranks, layer_sizes):
+            x = self.ORIGIN_X + depth * self.X_SPACING
+            y = int(round(self.ORIGIN_Y + (rank - (size - 1) / 2) * self.Y_SPACING))
+            positions.append([x, y])
+            min_x, min_y = min(min_x, x), min(min_y, y)
+            max_x, max_y = max(max_x, x), max(max_y, y)
+        return positions, (min_x, min_y, max_x, max_y)
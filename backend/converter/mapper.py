@@ -1,15 +1,28 @@
 import json
-from .utils import NodeUtils
+from .utils import NodeUtils, NodeIdAllocator
 from .transformer import ParameterTransformer
+from .resolver import MappingResolver
+from .layout import LayoutEngine
+from .connections import ConnectionTable
+from .diagnostics import DiagnosticsCollector
 
 class MakeComToN8nMapper:
-    def __init__(self, mappings: dict):
+    def __init__(self, mappings: dict, auto_layout: bool = True, resolver: MappingResolver = None,
+                 expression_cache: dict = None):
+        """
+        `resolver` and `expression_cache` may be passed in to share them between
+        mappers, e.g. across all workflows of a bundle.
+        """
         self.mappings = mappings
-        self.parameter_transformer = ParameterTransformer(mappings)
+        self.auto_layout = auto_layout
+        self.resolver = resolver or MappingResolver(mappings)
+        self.diagnostics = DiagnosticsCollector()
+        self.parameter_transformer = ParameterTransformer(mappings, self.resolver, self.diagnostics, expression_cache)
         self.n8n_nodes = []
-        self.n8n_connections = {}
         self.make_module_id_to_n8n_node_id = {}
-        self.warnings = []
+        self.n8n_node_id_to_name = {}
+        self.connection_table = ConnectionTable(self.n8n_node_id_to_name)
+        self.id_allocator = NodeIdAllocator()
 
     def map_workflow(self, make_modules: list):
         """
@@ -21,14 +34,12 @@ class MakeComToN8nMapper:
             make_module_type = make_module.get("module")
             make_module_name = make_module.get("metadata", {}).get("designer", {}).get("name", f"Module {make_module_id}")
 
-            n8n_node_id = NodeUtils.generate_node_id(make_module_name)
+            n8n_node_id = self.id_allocator.allocate_id(make_module_name)
             self.make_module_id_to_n8n_node_id[make_module_id] = n8n_node_id
 
             n8n_node = self._create_n8n_node(make_module, n8n_node_id, make_module_name)
-            if n8n_node:
-                self.n8n_nodes.append(n8n_node)
-            else:
-                self.warnings.append(f"Could not map Make.com module '{make_module_type}' (ID: {make_module_id}, Name: '{make_module_name}'). A placeholder node has been created.")
+            if not n8n_node:
+                self.diagnostics.add(DiagnosticsCollector.UNMAPPED_MODULE, make_module_type, module_id=make_module_id)
                 # Create a placeholder node for unmapped modules
                 placeholder_node = {
                     "id": n8n_node_id,
@@ -40,7 +51,11 @@ class MakeComToN8nMapper:
                     },
                     "typeVersion": 1
                 }
-                self.n8n_nodes.append(placeholder_node)
+                n8n_node = placeholder_node
+
+            n8n_node["name"] = self.id_allocator.allocate_name(n8n_node["name"])
+            self.n8n_node_id_to_name[n8n_node_id] = n8n_node["name"]
+            self.n8n_nodes.append(n8n_node)
 
 
         # Second pass: Establish connections
@@ -60,31 +75,39 @@ class MakeComToN8nMapper:
                 next_n8n_id = self.make_module_id_to_n8n_node_id.get(next_make_id)
 
                 if next_n8n_id:
-                    self._add_connection(current_n8n_id, next_n8n_id, "main", 0)
+                    self.connection_table.add(current_n8n_id, next_n8n_id, 0)
 
             # Handle router connections (e.g., BasicRouter)
             if make_module.get("module") == "builtin:BasicRouter" and "routes" in make_module:
+                # One output per route, so route indexes line up with switch outputs
+                self.connection_table.preallocate(current_n8n_id, len(make_module["routes"]))
                 for route_index, route in enumerate(make_module["routes"]):
                     if "flow" in route and route["flow"]:
                         first_node_in_route_make_id = route["flow"][0].get("id")
                         first_node_in_route_n8n_id = self.make_module_id_to_n8n_node_id.get(first_node_in_route_make_id)
                         if first_node_in_route_n8n_id:
-                            self._add_connection(current_n8n_id, first_node_in_route_n8n_id, "main", route_index)
+                            self.connection_table.add(current_n8n_id, first_node_in_route_n8n_id, route_index)
         
+        # Lay out the whole graph at once instead of trusting Make.com designer coordinates
+        bounds = self._apply_layout() if self.auto_layout else None
+
         # Add unconvertible expression warnings to a sticky note if any
-        if self.parameter_transformer.unconvertible_expressions:
-            sticky_note_id = NodeUtils.generate_node_id("unconvertible-expressions-warning")
-            sticky_note_content = "## Unconvertible Expressions Warning\n\nThe following expressions from the Make.com workflow could not be directly converted to n8n expressions and have been removed or replaced with placeholders. Manual review and adjustment are required:\n\n"
-            for expr_warning in self.parameter_transformer.unconvertible_expressions:
-                sticky_note_content += f"- {expr_warning}\n"
+        if self.diagnostics.has(DiagnosticsCollector.UNCONVERTIBLE_EXPRESSION):
+            sticky_note_id = self.id_allocator.allocate_id("unconvertible-expressions-warning")
+            sticky_note_content = self.diagnostics.render_note(
+                DiagnosticsCollector.UNCONVERTIBLE_EXPRESSION,
+                "## Unconvertible Expressions Warning\n\nThe following expressions from the Make.com workflow could not be directly converted to n8n expressions and have been removed or replaced with placeholders. Manual review and adjustment are required:\n\n"
+            )
             
             # Find a suitable position for the sticky note (e.g., top-left)
-            min_x = min(node["position"][0] for node in self.n8n_nodes) if self.n8n_nodes else 0
-            min_y = min(node["position"][1] for node in self.n8n_nodes) if self.n8n_nodes else 0
+            if bounds is None and self.n8n_nodes:
+                xs, ys = zip(*(node["position"] for node in self.n8n_nodes))
+                bounds = (min(xs), min(ys), max(xs), max(ys))
+            min_x, min_y = bounds[:2] if bounds else (0, 0)
 
-            self.n8n_nodes.insert(0, { # Insert at the beginning for visibility
+            self.n8n_nodes.append({ # Canvas position, not list order, decides where n8n shows it
                 "id": sticky_note_id,
-                "name": "Unconvertible Expressions",
+                "name": self.id_allocator.allocate_name("Unconvertible Expressions"),
                 "type": "n8n-nodes-base.stickyNote",
                 "position": [min_x - 300, min_y - 200], # Offset from the top-leftmost node
                 "parameters": {
@@ -95,13 +118,12 @@ class MakeComToN8nMapper:
                 },
                 "typeVersion": 1
             })
-            self.warnings.append("Some Make.com expressions could not be converted. Please check the 'Unconvertible Expressions' sticky note in the generated n8n workflow for details.")
 
 
         return {
             "nodes": self.n8n_nodes,
-            "connections": self.n8n_connections,
-            "warnings": self.warnings
+            "connections": self.connection_table.connections,
+            "warnings": self.diagnostics.records()
         }
 
     def _create_n8n_node(self, make_module: dict, n8n_node_id: str, make_module_name: str):
@@ -109,7 +131,7 @@ class MakeComToN8nMapper:
         Creates an n8n node from a Make.com module.
         """
         make_module_type = make_module.get("module")
-        mapping = self.mappings.get(make_module_type)
+        mapping = self.resolver.resolve(make_module_type)
 
         if not mapping:
             return None # Indicate that this module could not be mapped
@@ -124,22 +146,18 @@ class MakeComToN8nMapper:
         }
         return n8n_node
 
-    def _add_connection(self, from_node_id: str, to_node_id: str, type: str, index: int):
+    def _apply_layout(self):
         """
-        Adds a connection to the n8n connections dictionary.
+        Recomputes every node position from the connection graph.
+        Returns the bounding box of the laid out nodes.
         """
-        if from_node_id not in self.n8n_connections:
-            self.n8n_connections[from_node_id] = {}
-        
-        if type not in self.n8n_connections[from_node_id]:
-            self.n8n_connections[from_node_id][type] = []
-        
-        # Ensure the list is long enough for the given index
-        while len(self.n8n_connections[from_node_id][type]) <= index:
-            self.n8n_connections[from_node_id][type].append([])
-
-        self.n8n_connections[from_node_id][type][index].append({
-            "node": to_node_id,
-            "type": "main", # Assuming 'main' connection type for now
-            "index": 0 # Assuming first input for now
-        })
\ No newline at end of file
+        node_index = {node["id"]: i for i, node in enumerate(self.n8n_nodes)}
+        edges = [
+            (node_index[source], output_index, node_index[target])
+            for source, output_index, target in self.connection_table.edges
+            if source in node_index and target in node_index
+        ]
+        positions, bounds = LayoutEngine().layout(len(self.n8n_nodes), edges)
+        for node, position in zip(self.n8n_nodes, positions):
+            node["position"] = position
+        return bounds
@@ -0,0 +1,66 @@
+class MappingResolver:
+    """
+    Resolves Make.com module types to their n8n mapping.
+    Supports three kinds of mapping keys, in order of precedence:
+      - exact keys, e.g. "google-sheets:ActionAddRow"
+      - prefix keys ending in '*', e.g. "google-sheets:*" (longest prefix wins)
+      - the bare wildcard "*", used as a last resort
+    Prefix keys are stored in a character trie so a lookup costs O(len(module_type)).
+    """
+
+    WILDCARD = "*"
+
+    def __init__(self, mappings: dict):
+        self.mappings = mappings
+        self._exact = {}
+        self._trie = {}
+        self._default = None
+        self._cache = {}
+
+        for key, mapping in mappings.items():
+            if key == self.WILDCARD:
+                self._default = mapping
+            elif key.endswith(self.WILDCARD):
+                self._insert_prefix(key[:-1], mapping)
+            else:
+                self._exact[key] = mapping
+
+    def _insert_prefix(self, prefix: str, mapping: dict):
+        """
+        Adds a prefix entry to the trie. The mapping is stored on the node
+        reached after consuming the whole prefix.
+        """
+        node = self._trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[self.WILDCARD] = mapping
+
+    def resolve(self, module_type: str):
+        """
+        Returns the mapping for a Make.com module type, or None if nothing matches.
+        Results (including misses) are memoized per module type.
+        """
+        if module_type in self._cache:
+            return self._cache[module_type]
+
+        mapping = self._lookup(module_type)
+        self._cache[module_type] = mapping
+        return mapping
+
+    def _lookup(self, module_type: str):
+        if not module_type:
+            return self._default
+
+        if module_type in self._exact:
+            return self._exact[module_type]
+
+        # Walk the trie, remembering the deepest prefix entry seen
+        best = self._trie.get(self.WILDCARD, self._default)
+        node = self._trie
+        for char in module_type:
+            node = node.get(char)
+            if node is None:
+                break
+            if self.WILDCARD in node:
+                best = node[self.WILDCARD]
+        return best
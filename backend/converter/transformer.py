@@ -1,9 +1,21 @@
 import re
+from .resolver import MappingResolver
+from .diagnostics import DiagnosticsCollector
 
 class ParameterTransformer:
-    def __init__(self, mappings: dict):
+    # Upper bound on distinct strings kept in the expression cache
+    EXPRESSION_CACHE_SIZE = 10000
+
+    def __init__(self, mappings: dict, resolver: MappingResolver = None, diagnostics: DiagnosticsCollector = None,
+                 expression_cache: dict = None):
         self.mappings = mappings
-        self.unconvertible_expressions = []
+        self.resolver = resolver or MappingResolver(mappings)
+        self.diagnostics = diagnostics or DiagnosticsCollector()
+        # Maps a Make.com string value to (converted value, diagnostics it raised).
+        # May be shared between transformers, e.g. across the workflows of a bundle.
+        self.expression_cache = expression_cache if expression_cache is not None else {}
+        self._current_module = {}
+        self._issues = []
         # Dictionary of common Make.com functions and their n8n equivalents
         self.function_mappings = {
             "parseDate": "new Date",
@@ -28,7 +40,8 @@ class ParameterTransformer:
         """
         n8n_parameters = {}
         module_type = make_module.get("module")
-        module_mapping = self.mappings.get(module_type, {})
+        self._current_module = make_module
+        module_mapping = self.resolver.resolve(module_type) or {}
         parameter_map = module_mapping.get("parameters", {})
 
         make_parameters = make_module.get("parameters", {})
@@ -82,10 +95,26 @@ class ParameterTransformer:
         """
         Converts Make.com expressions (e.g., {{...}}) to n8n expressions (e.g., ={{...}}).
         Handles various Make.com expression patterns and functions.
+        Results are cached per string; diagnostics raised by a cached conversion are
+        replayed so they are still attributed to the current module.
         """
         if not isinstance(value, str):
             return value
 
+        cached = self.expression_cache.get(value)
+        if cached is not None:
+            converted, issues = cached
+            for kind, expression in issues:
+                self._report(kind, expression)
+            return converted
+
+        self._issues = []
+        converted = self._convert_string(value)
+        if len(self.expression_cache) < self.EXPRESSION_CACHE_SIZE:
+            self.expression_cache[value] = (converted, tuple(self._issues))
+        return converted
+
+    def _convert_string(self, value: str):
         # Regex to find Make.com expressions: {{...}}
         make_expression_pattern = r"\{\{(.*?)\}\}"
         
@@ -141,7 +170,7 @@ class ParameterTransformer:
                     # Replace the function name and keep arguments
                     expression_content = re.sub(pattern, f'{n8n_func}(\\1)', expression_content)
                 except Exception as e:
-                    self.unconvertible_expressions.append(f"Error converting function {make_func}: {str(e)}")
+                    self._report(DiagnosticsCollector.UNCONVERTIBLE_EXPRESSION, f"{make_func}(): {str(e)}")
         
         # Handle array references like myArray[0]
         if re.search(r'\[\d+\]', expression_content):
@@ -157,9 +186,13 @@ class ParameterTransformer:
             return f"{{ {expression_content} }}"
             
         # For other cases, mark as potentially unconvertible
-        self.unconvertible_expressions.append(f"Potentially unconvertible expression: {{{{{expression_content}}}}}")
+        self._report(DiagnosticsCollector.UNCONVERTIBLE_EXPRESSION, expression_content)
         return f"/* REVIEW_EXPRESSION: {{{{{expression_content}}}}} */"
 
+    def _report(self, kind: str, expression: str):
+        self._issues.append((kind, expression))
+        self.diagnostics.add(kind, self._current_module.get("module"), expression, self._current_module.get("id"))
+
     def _map_operator(self, make_operator):
         """
         Maps Make.com operators to n8n operators.
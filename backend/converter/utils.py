@@ -1,3 +1,8 @@
+import re
+
+# Compiled once at import time; used for every node ID slug
+_SLUG_PATTERN = re.compile(r'\W+')
+
 class NodeUtils:
     @staticmethod
     def calculate_n8n_position(make_position: dict):
@@ -17,6 +22,49 @@ class NodeUtils:
         This is a placeholder and might need more robust UUID generation in a real app.
         """
         # Simple slugification for ID
-        import re
-        slug = re.sub(r'\W+', '-', node_name).lower()
-        return f"{slug}"
\ No newline at end of file
+        slug = _SLUG_PATTERN.sub('-', node_name).lower()
+        return f"{slug}"
+
+
+class NodeIdAllocator:
+    """
+    Hands out node IDs and node names that are unique within one workflow.
+    Collisions get a numeric suffix ("http-1", "HTTP1", ...). A counter is kept
+    per base value, so resolving a collision does not rescan earlier suffixes.
+    """
+
+    def __init__(self):
+        self._used_ids = set()
+        self._used_names = set()
+        self._id_counters = {}
+        self._name_counters = {}
+
+    def allocate_id(self, node_name: str):
+        """
+        Returns a unique slug ID derived from the node name.
+        """
+        base = NodeUtils.generate_node_id(node_name)
+        return self._unique(base, self._used_ids, self._id_counters, "{}-{}")
+
+    def allocate_name(self, node_name: str):
+        """
+        Returns a unique display name. n8n keys connections by node name,
+        so two nodes must never share one.
+        """
+        return self._unique(node_name, self._used_names, self._name_counters, "{}{}")
+
+    @staticmethod
+    def _unique(base: str, used: set, counters: dict, pattern: str):
+        if base not in used:
+            used.add(base)
+            return base
+
+        counter = counters.get(base, 1)
+        candidate = pattern.format(base, counter)
+        # Only loops when a literal "base-N" was already taken by another node
+        while candidate in used:
+            counter += 1
+            candidate = pattern.format(base, counter)
+        counters[base] = counter + 1
+        used.add(candidate)
+        return candidate
@@ -0,0 +1,160 @@
+import json
+import queue
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import closing
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    input_hash TEXT NOT NULL,
+    mapping_version TEXT NOT NULL,
+    workflow_name TEXT,
+    module_count INTEGER NOT NULL,
+    node_count INTEGER NOT NULL,
+    unmapped_count INTEGER NOT NULL,
+    total_ms REAL NOT NULL,
+    stage_timings TEXT NOT NULL,
+    output BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_conversions_input_hash ON conversions (input_hash);
+CREATE INDEX IF NOT EXISTS idx_conversions_total_ms ON conversions (total_ms);
+
+CREATE TABLE IF NOT EXISTS conversion_modules (
+    conversion_id INTEGER NOT NULL REFERENCES conversions (id),
+    module_type TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    unmapped INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_conversion_modules_type ON conversion_modules (module_type);
+CREATE INDEX IF NOT EXISTS idx_conversion_modules_conversion ON conversion_modules (conversion_id);
+"""
+
+_SUMMARY_COLUMNS = "id, created_at, input_hash, mapping_version, workflow_name, module_count, node_count, unmapped_count, total_ms, stage_timings"
+
+
+class ConversionHistory:
+    """
+    Optional SQLite store of past conversions.
+    record() only enqueues; a background thread writes queued records in
+    batches, so the request path never waits on disk I/O.
+    """
+
+    def __init__(self, path: str, batch_size: int = 50, flush_interval: float = 2.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+        self._writer = threading.Thread(target=self._write_loop, name="conversion-history-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10)
+
+    def record(self, input_hash: str, mapping_version: str, workflow_name: str, module_counts: dict,
+               unmapped_types: set, node_count: int, stage_timings: dict, output: bytes = None):
+        """
+        Queues one conversion for writing. `module_counts` maps module type to the
+        number of modules of that type; `stage_timings` maps stage name to milliseconds.
+        """
+        self._queue.put((
+            time.time(),
+            input_hash,
+            mapping_version,
+            workflow_name,
+            module_counts,
+            unmapped_types,
+            node_count,
+            stage_timings,
+            output # Compressed by the writer thread, off the request path
+        ))
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(conn, batch)
+            except sqlite3.Error as e:
+                print(f"Warning: could not write conversion history: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, conn, batch: list):
+        with conn:
+            for (created_at, input_hash, mapping_version, workflow_name, module_counts,
+                 unmapped_types, node_count, stage_timings, output) in batch:
+                cursor = conn.execute(
+                    "INSERT INTO conversions (created_at, input_hash, mapping_version, workflow_name, module_count,"
+                    " node_count, unmapped_count, total_ms, stage_timings, output) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (created_at, input_hash, mapping_version, workflow_name, sum(module_counts.values()),
+                     node_count, sum(module_counts.get(t, 0) for t in unmapped_types),
+                     sum(stage_timings.values()), json.dumps(stage_timings),
+                     zlib.compress(output) if output is not None else None)
+                )
+                conn.executemany(
+                    "INSERT INTO conversion_modules (conversion_id, module_type, count, unmapped) VALUES (?, ?, ?, ?)",
+                    [(cursor.lastrowid, module_type, count, int(module_type in unmapped_types))
+                     for module_type, count in module_counts.items()]
+                )
+
+    def flush(self):
+        """
+        Blocks until every queued record has been written.
+        """
+        self._queue.join()
+
+    def recent(self, limit: int = 20):
+        return self._query(f"SELECT {_SUMMARY_COLUMNS} FROM conversions ORDER BY id DESC LIMIT ?", (limit,))
+
+    def slowest(self, limit: int = 20):
+        return self._query(f"SELECT {_SUMMARY_COLUMNS} FROM conversions ORDER BY total_ms DESC LIMIT ?", (limit,))
+
+    def by_hash(self, input_hash: str):
+        return self._query(f"SELECT {_SUMMARY_COLUMNS} FROM conversions WHERE input_hash = ? ORDER BY id DESC", (input_hash,))
+
+    def by_module_type(self, module_type: str, limit: int = 20):
+        return self._query(
+            f"SELECT {_SUMMARY_COLUMNS} FROM conversions WHERE id IN"
+            " (SELECT conversion_id FROM conversion_modules WHERE module_type = ?) ORDER BY id DESC LIMIT ?",
+            (module_type, limit)
+        )
+
+    def output(self, conversion_id: int):
+        """
+        Returns the decompressed output body of a stored conversion, or None.
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT output FROM conversions WHERE id = ?", (conversion_id,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return zlib.decompress(row[0])
+
+    def _query(self, sql: str, params: tuple):
+        with closing(self._connect()) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(sql, params).fetchall()
+        results = []
+        for row in rows:
+            item = dict(row)
+            item["stage_timings"] = json.loads(item["stage_timings"])
+            results.append(item)
+        return results
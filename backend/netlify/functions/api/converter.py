@@ -296,13 +296,69 @@ class ParameterTransformer:
                         current[part] = {}
                     current = current[part]
 
+class ConnectionTable:
+    """
+    Collects connections between n8n nodes and stores them directly in the
+    shape n8n expects:
+    {
+      "Source Node Name": {
+        "main": [
+          [ {"node": "Target Node Name", "type": "main", "index": 0} ],  # output 0
+          [ ... ]                                                        # output 1
+        ]
+      }
+    }
+    Callers refer to nodes by their stable node IDs; `node_names` translates
+    them to display names as edges are added, so no formatting pass is needed.
+    """
+
+    def __init__(self, node_names: dict):
+        self.node_names = node_names
+        self.connections = {}
+        self.edges = []  # (source_id, output_index, target_id), in insertion order
+        self._seen = set()
+
+    def preallocate(self, source_id: str, output_count: int, type: str = "main"):
+        """
+        Reserves `output_count` outputs for a node up front, e.g. one per router route.
+        """
+        outputs = self._outputs(source_id, type)
+        if len(outputs) < output_count:
+            outputs.extend([] for _ in range(output_count - len(outputs)))
+
+    def add(self, source_id: str, target_id: str, output_index: int = 0, type: str = "main"):
+        """
+        Adds an edge from an output of the source node to the target node.
+        Returns False if the same edge was already present.
+        """
+        key = (source_id, type, output_index, target_id)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        self.edges.append((source_id, output_index, target_id))
+
+        outputs = self._outputs(source_id, type)
+        if len(outputs) <= output_index:
+            outputs.extend([] for _ in range(output_index + 1 - len(outputs)))
+        outputs[output_index].append({
+            "node": self.node_names[target_id],
+            "type": "main", # Assuming 'main' connection type for now
+            "index": 0 # Assuming first input for now
+        })
+        return True
+
+    def _outputs(self, source_id: str, type: str):
+        source = self.connections.setdefault(self.node_names[source_id], {})
+        return source.setdefault(type, [])
+
 class MakeComToN8nMapper:
     def __init__(self, mappings: dict):
         self.mappings = mappings
         self.parameter_transformer = ParameterTransformer(mappings)
         self.n8n_nodes = []
-        self.n8n_connections = {}
         self.make_module_id_to_n8n_node_id = {}
+        self.n8n_node_id_to_name = {}
+        self.connection_table = ConnectionTable(self.n8n_node_id_to_name)
         self.warnings = []
 
     def map_workflow(self, make_modules: list):
@@ -320,6 +376,7 @@ class MakeComToN8nMapper:
 
             n8n_node = self._create_n8n_node(make_module, n8n_node_id, make_module_name)
             if n8n_node:
+                self.n8n_node_id_to_name[n8n_node_id] = n8n_node["name"]
                 self.n8n_nodes.append(n8n_node)
             else:
                 self.warnings.append(f"Could not map Make.com module '{make_module_type}' (ID: {make_module_id}, Name: '{make_module_name}'). A placeholder node has been created.")
@@ -334,6 +391,7 @@ class MakeComToN8nMapper:
                     },
                     "typeVersion": 1
                 }
+                self.n8n_node_id_to_name[n8n_node_id] = placeholder_node["name"]
                 self.n8n_nodes.append(placeholder_node)
 
 
@@ -352,16 +410,17 @@ class MakeComToN8nMapper:
                 next_n8n_id = self.make_module_id_to_n8n_node_id.get(next_make_id)
 
                 if next_n8n_id:
-                    self._add_connection(current_n8n_id, next_n8n_id, "main", 0)
+                    self.connection_table.add(current_n8n_id, next_n8n_id, 0)
 
             # Handle router connections (e.g., BasicRouter)
             if make_module.get("module") == "builtin:BasicRouter" and "routes" in make_module:
+                self.connection_table.preallocate(current_n8n_id, len(make_module["routes"]))
                 for route_index, route in enumerate(make_module["routes"]):
                     if "flow" in route and route["flow"]:
                         first_node_in_route_make_id = route["flow"][0].get("id")
                         first_node_in_route_n8n_id = self.make_module_id_to_n8n_node_id.get(first_node_in_route_make_id)
                         if first_node_in_route_n8n_id:
-                            self._add_connection(current_n8n_id, first_node_in_route_n8n_id, "main", route_index)
+                            self.connection_table.add(current_n8n_id, first_node_in_route_n8n_id, route_index)
         
         # Add unconvertible expression warnings to a sticky note if any
         if self.parameter_transformer.unconvertible_expressions:
@@ -392,7 +451,7 @@ class MakeComToN8nMapper:
 
         return {
             "nodes": self.n8n_nodes,
-            "connections": self.n8n_connections,
+            "connections": self.connection_table.connections,
             "warnings": self.warnings
         }
 
@@ -416,26 +475,6 @@ class MakeComToN8nMapper:
         }
         return n8n_node
 
-    def _add_connection(self, from_node_id: str, to_node_id: str, type: str, index: int):
-        """
-        Adds a connection to the n8n connections dictionary.
-        """
-        if from_node_id not in self.n8n_connections:
-            self.n8n_connections[from_node_id] = {}
-        
-        if type not in self.n8n_connections[from_node_id]:
-            self.n8n_connections[from_node_id][type] = []
-        
-        # Ensure the list is long enough for the given index
-        while len(self.n8n_connections[from_node_id][type]) <= index:
-            self.n8n_connections[from_node_id][type].append([])
-
-        self.n8n_connections[from_node_id][type][index].append({
-            "node": to_node_id,
-            "type": "main", # Assuming 'main' connection type for now
-            "index": 0 # Assuming first input for now
-        })
-
 class N8nWorkflowGenerator:
     def __init__(self, nodes: list, connections: dict, workflow_name: str = "Converted Workflow"):
         self.nodes = nodes
@@ -458,7 +497,7 @@ class N8nWorkflowGenerator:
             "id": workflow_id,
             "name": self.workflow_name,
             "nodes": self.nodes,
-            "connections": self._format_connections(),
+            "connections": self.connections,
             "active": False, # Default to inactive
             "settings": {
                 "executionOrder": "v1", # Default execution order
@@ -483,40 +522,6 @@ class N8nWorkflowGenerator:
         }
         
         return n8n_workflow
-    
-    def _format_connections(self):
-        """
-        Format connections into valid n8n format.
-        """
-        formatted_connections = {}
-        
-        # First check if connections is already in the right format
-        if self.connections and all(isinstance(v, dict) for v in self.connections.values()):
-            return self.connections
-        
-        # Otherwise, format it correctly
-        for source_node_id, targets in self.connections.items():
-            formatted_connections[source_node_id] = {
-                "main": []
-            }
-            
-            # n8n expects an array of arrays for outputs
-            main_outputs = []
-            
-            # If we have a list of targets, they go in the first output index
-            if isinstance(targets, list):
-                output_targets = []
-                for target in targets:
-                    output_targets.append({
-                        "node": target["node"],
-                        "type": "main",
-                        "index": target.get("index", 0)
-                    })
-                main_outputs.append(output_targets)
-            
-            formatted_connections[source_node_id]["main"] = main_outputs
-            
-        return formatted_connections
 
 # Fallback module mappings in case the JSON file can't be loaded
 FALLBACK_MODULE_MAPPINGS = {
@@ -0,0 +1,50 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class ResultCache:
+    """
+    Small in-process LRU cache of conversion responses, keyed by a hash of the
+    uploaded blueprint. Each entry holds the serialized JSON body plus any
+    compressed variants produced for it, so repeated downloads of the same
+    conversion are neither re-converted nor re-compressed.
+    """
+
+    IDENTITY = "identity"
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(raw: bytes):
+        return hashlib.sha256(raw).hexdigest()
+
+    def get(self, key: str, encoding: str = IDENTITY):
+        """
+        Returns the cached body for `key` in the given encoding, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry.get(encoding)
+
+    def put(self, key: str, body: bytes, encoding: str = IDENTITY):
+        """
+        Stores a body variant. Storing the identity body starts a new entry;
+        compressed variants are only kept while their identity body is cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if encoding != self.IDENTITY:
+                    return
+                entry = self._entries[key] = {}
+            entry[encoding] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,30 @@
+import io
+import json
+import zipfile
+
+from converter.bundle import WorkflowBundle
+
+MAPPINGS = {"http:ActionSendData": {"n8n_type": "n8n-nodes-base.httpRequest", "typeVersion": 3,
+                                    "parameters": {"url": "url"}}}
+
+
+def _blueprint(name):
+    return {"name": name, "flow": [{"id": 1, "module": "http:ActionSendData", "mapper": {"url": "{{1.url}}"}}]}
+
+
+def test_array_holds_one_workflow_per_blueprint_and_shares_the_expression_cache():
+    bundle = WorkflowBundle(MAPPINGS)
+    output = io.StringIO()
+    bundle.write_array(output, [("a.json", _blueprint("A")), ("b.json", _blueprint("B"))])
+    assert [workflow["name"] for workflow in json.loads(output.getvalue())] == ["A", "B"]
+    assert "{{1.url}}" in bundle.expression_cache
+    assert [report["source"] for report in bundle.reports] == ["a.json", "b.json"]
+
+
+def test_archive_entries_are_named_after_unique_sources():
+    output = io.BytesIO()
+    WorkflowBundle(MAPPINGS).write_archive(output, [("a.json", _blueprint("A")), ("a.json", _blueprint("B"))])
+    with zipfile.ZipFile(output) as archive:
+        names = archive.namelist()
+        assert len(set(names)) == 2
+        assert json.loads(archive.read(names[1]))["name"] == "B"
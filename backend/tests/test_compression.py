@@ -0,0 +1,64 @@
+import gzip
+
+import pytest
+
+import compression
+from compression import compress_chunks, negotiate_encoding
+
+
+@pytest.fixture
+def all_encoders(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", object())
+    monkeypatch.setattr(compression, "zstandard", object())
+
+
+@pytest.fixture
+def gzip_only(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    monkeypatch.setattr(compression, "zstandard", None)
+
+
+def test_highest_q_value_wins(all_encoders):
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5, zstd;q=0.8", 4096) == "gzip"
+    assert negotiate_encoding("gzip;q=0.2, br", 4096) == "br"
+
+
+def test_equal_q_values_use_server_preference(all_encoders):
+    assert negotiate_encoding("gzip, br, zstd", 4096) == "zstd"
+    assert negotiate_encoding("GZIP, BR", 4096) == "br"
+
+
+def test_q_zero_and_malformed_q_values_refuse_an_encoding(gzip_only):
+    assert negotiate_encoding("gzip;q=0", 4096) is None
+    assert negotiate_encoding("gzip;q=high", 4096) is None
+
+
+def test_wildcard_covers_unlisted_encodings(all_encoders):
+    assert negotiate_encoding("*", 4096) == "zstd"
+    assert negotiate_encoding("zstd;q=0, br;q=0, *;q=0.5", 4096) == "gzip"
+    assert negotiate_encoding("gzip, *;q=0", 4096) == "gzip"
+    assert negotiate_encoding("*;q=0", 4096) is None
+
+
+def test_identity_only_means_no_compression(gzip_only):
+    assert negotiate_encoding("identity", 4096) is None
+    assert negotiate_encoding("identity, *;q=0", 4096) is None
+
+
+def test_small_bodies_and_missing_header_are_not_compressed(gzip_only):
+    assert negotiate_encoding("gzip", compression.MIN_COMPRESS_SIZE - 1) is None
+    assert negotiate_encoding("gzip", compression.MIN_COMPRESS_SIZE) == "gzip"
+    assert negotiate_encoding("gzip", 10, min_size=0) == "gzip"
+    assert negotiate_encoding("", 4096) is None
+
+
+def test_gzip_chunks_round_trip():
+    data = b'{"nodes": [' + b'{"name": "Set"},' * 20000 + b'{}]}'
+    chunks = list(compress_chunks(data, "gzip", chunk_size=1024))
+    assert len(chunks) > 1
+    assert gzip.decompress(b"".join(chunks)) == data
+
+
+def test_unknown_encoding_is_rejected():
+    with pytest.raises(ValueError):
+        list(compress_chunks(b"data", "deflate"))
@@ -0,0 +1,26 @@
+from converter.connections import ConnectionTable
+
+
+def _targets(table, source_name):
+    return [[(edge["node"], edge["index"]) for edge in output] for output in table.connections[source_name]["main"]]
+
+
+def test_edges_are_stored_by_node_name():
+    table = ConnectionTable({"a": "A", "b": "B"})
+    assert table.add("a", "b")
+    assert _targets(table, "A") == [[("B", 0)]]
+    assert table.edges == [("a", 0, "b")]
+
+
+def test_duplicate_edges_are_ignored():
+    table = ConnectionTable({"a": "A", "b": "B"})
+    table.add("a", "b")
+    assert not table.add("a", "b")
+    assert _targets(table, "A") == [[("B", 0)]]
+
+
+def test_preallocate_keeps_route_indexes_aligned():
+    table = ConnectionTable({"router": "Router", "b": "B"})
+    table.preallocate("router", 3)
+    table.add("router", "b", 2)
+    assert _targets(table, "Router") == [[], [], [("B", 0)]]
@@ -0,0 +1,37 @@
+from converter.diagnostics import DiagnosticsCollector
+
+
+def test_repeats_fold_into_one_record_with_sampled_modules():
+    diagnostics = DiagnosticsCollector()
+    for module_id in range(8):
+        diagnostics.add(DiagnosticsCollector.UNMAPPED_MODULE, "x:Y", module_id=module_id)
+    record, = diagnostics.records()
+    assert record["count"] == 8
+    assert record["modules"] == list(range(DiagnosticsCollector.MAX_MODULE_SAMPLES))
+    assert "expression" not in record
+
+
+def test_records_are_capped_with_a_truncation_marker():
+    diagnostics = DiagnosticsCollector()
+    total = DiagnosticsCollector.MAX_RECORDS + 10
+    for i in range(total):
+        diagnostics.add(DiagnosticsCollector.UNMAPPED_MODULE, f"app:Module{i}")
+    records = diagnostics.records()
+    assert len(records) == DiagnosticsCollector.MAX_RECORDS + 1
+    assert records[-1] == {"kind": "truncated", "count": 10}
+
+
+def test_records_filter_by_kind():
+    diagnostics = DiagnosticsCollector()
+    diagnostics.add(DiagnosticsCollector.UNMAPPED_MODULE, "x:Y")
+    diagnostics.add(DiagnosticsCollector.UNCONVERTIBLE_EXPRESSION, "x:Y", "foo(1)")
+    assert diagnostics.has(DiagnosticsCollector.UNCONVERTIBLE_EXPRESSION)
+    assert [r["kind"] for r in diagnostics.records(DiagnosticsCollector.UNMAPPED_MODULE)] == ["unmapped_module"]
+
+
+def test_render_note_lists_expressions_with_counts():
+    diagnostics = DiagnosticsCollector()
+    diagnostics.add(DiagnosticsCollector.UNCONVERTIBLE_EXPRESSION, "x:Y", "foo(1)")
+    diagnostics.add(DiagnosticsCollector.UNCONVERTIBLE_EXPRESSION, "x:Y", "foo(1)")
+    note = diagnostics.render_note(DiagnosticsCollector.UNCONVERTIBLE_EXPRESSION, "## Header\n")
+    assert note == "## Header\n- {{foo(1)}} in x:Y (2x)\n"
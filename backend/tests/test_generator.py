@@ -0,0 +1,26 @@
+import json
+
+import pytest
+
+from converter.generator import N8nWorkflowGenerator
+
+
+def test_full_profile_has_ids_and_metadata():
+    workflow = N8nWorkflowGenerator([], {}, "Scenario").generate_workflow()
+    assert workflow["name"] == "Scenario"
+    assert workflow["active"] is False
+    assert workflow["id"] != workflow["versionId"]
+    assert workflow["meta"]["convertedFromMakeCom"] is True
+
+
+def test_compact_profile_leaves_out_import_defaults():
+    generator = N8nWorkflowGenerator([{"id": "a", "name": "A", "type": "t", "position": [0, 0], "parameters": {}}], {}, "Scenario", N8nWorkflowGenerator.COMPACT)
+    workflow = generator.generate_workflow()
+    assert set(workflow) == {"settings", "tags", "meta", "name", "nodes", "connections"}
+    assert json.loads(generator.to_json(workflow))["nodes"][0]["id"] == "a"
+    assert "\n" not in generator.to_json(workflow)
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        N8nWorkflowGenerator([], {}, profile="tiny")
@@ -0,0 +1,52 @@
+import threading
+
+from history import ConversionHistory
+
+
+def _record(history, input_hash, stage_timings=None):
+    history.record(input_hash, "v1", "Workflow", {"http:ActionSendData": 2, "x:Y": 1}, {"x:Y"}, 3,
+                   stage_timings or {"map": 1.5, "generate": 0.5}, b'{"nodes": []}')
+
+
+def test_records_are_written_and_queryable(tmp_path):
+    history = ConversionHistory(str(tmp_path / "history.db"), flush_interval=0.01)
+    _record(history, "abc")
+    history.flush()
+    row, = history.by_hash("abc")
+    assert row["module_count"] == 3
+    assert row["unmapped_count"] == 1
+    assert row["total_ms"] == 2.0
+    assert history.by_module_type("x:Y")[0]["id"] == row["id"]
+    assert history.output(row["id"]) == b'{"nodes": []}'
+
+
+def test_bad_record_is_skipped_and_the_writer_keeps_running(tmp_path):
+    history = ConversionHistory(str(tmp_path / "history.db"), flush_interval=0.01)
+    _record(history, "bad", {"map": "slow"}) # sum() of the timings raises TypeError
+    _record(history, "good")
+    history.flush()
+    _record(history, "later")
+    history.flush()
+    assert history.dropped == 1
+    assert [row["input_hash"] for row in history.recent()] == ["later", "good"]
+
+
+def test_records_beyond_the_queue_bound_are_dropped(tmp_path):
+    history = ConversionHistory(str(tmp_path / "history.db"), batch_size=1, max_queue=1)
+    writing, release = threading.Event(), threading.Event()
+    write_batch = history._write_batch
+
+    def blocked_write(conn, batch):
+        writing.set()
+        release.wait()
+        write_batch(conn, batch)
+
+    history._write_batch = blocked_write
+    _record(history, "first") # Taken by the writer, which then blocks
+    assert writing.wait(5)
+    _record(history, "queued")
+    _record(history, "dropped")
+    release.set()
+    history.flush()
+    assert history.dropped == 1
+    assert {row["input_hash"] for row in history.recent()} == {"first", "queued"}
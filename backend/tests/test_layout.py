@@ -0,0 +1,24 @@
+from converter.layout import LayoutEngine
+
+
+def test_empty_graph_has_no_bounds():
+    assert LayoutEngine().layout(0, []) == ([], None)
+
+
+def test_chain_is_laid_out_in_columns():
+    positions, bounds = LayoutEngine().layout(3, [(0, 0, 1), (1, 0, 2)])
+    xs = [x for x, _ in positions]
+    assert xs == sorted(xs) and len(set(xs)) == 3
+    assert len({y for _, y in positions}) == 1
+    assert bounds == (min(xs), positions[0][1], max(xs), positions[0][1])
+
+
+def test_router_branches_get_separate_lanes():
+    positions, _ = LayoutEngine().layout(3, [(0, 0, 1), (0, 1, 2)])
+    assert positions[1][0] == positions[2][0]
+    assert positions[1][1] < positions[2][1]
+
+
+def test_cycles_do_not_hang_the_layout():
+    positions, _ = LayoutEngine().layout(2, [(0, 0, 1), (1, 0, 0)])
+    assert len(positions) == 2
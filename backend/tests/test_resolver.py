@@ -0,0 +1,31 @@
+from converter.resolver import MappingResolver
+
+MAPPINGS = {
+    "*": {"n8n_type": "default"},
+    "google-sheets:*": {"n8n_type": "sheets"},
+    "google-sheets:Action*": {"n8n_type": "sheets-action"},
+    "google-sheets:ActionAddRow": {"n8n_type": "sheets-add-row"}
+}
+
+
+def test_exact_key_wins_over_prefixes():
+    assert MappingResolver(MAPPINGS).resolve("google-sheets:ActionAddRow")["n8n_type"] == "sheets-add-row"
+
+
+def test_longest_prefix_wins():
+    resolver = MappingResolver(MAPPINGS)
+    assert resolver.resolve("google-sheets:ActionUpdateRow")["n8n_type"] == "sheets-action"
+    assert resolver.resolve("google-sheets:watchRows")["n8n_type"] == "sheets"
+
+
+def test_bare_wildcard_is_the_last_resort():
+    resolver = MappingResolver(MAPPINGS)
+    assert resolver.resolve("slack:CreateMessage")["n8n_type"] == "default"
+    assert resolver.resolve("")["n8n_type"] == "default"
+
+
+def test_miss_without_wildcard_is_none_and_memoized():
+    resolver = MappingResolver({"http:*": {"n8n_type": "http"}})
+    assert resolver.resolve("slack:CreateMessage") is None
+    assert "slack:CreateMessage" in resolver._cache
+    assert resolver.resolve("http:ActionSendData")["n8n_type"] == "http"
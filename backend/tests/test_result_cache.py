@@ -0,0 +1,28 @@
+from result_cache import ResultCache
+
+
+def test_get_returns_stored_identity_body():
+    cache = ResultCache()
+    cache.put("k", b"{}")
+    assert cache.get("k") == b"{}"
+    assert cache.get("missing") is None
+
+
+def test_compressed_variants_need_the_identity_body():
+    cache = ResultCache()
+    cache.put("k", b"gz", "gzip")
+    assert cache.get("k", "gzip") is None
+    cache.put("k", b"{}")
+    cache.put("k", b"gz", "gzip")
+    assert cache.get("k", "gzip") == b"gz"
+    assert cache.get("k") == b"{}"
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", b"a")
+    cache.put("b", b"b")
+    cache.get("a")
+    cache.put("c", b"c")
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
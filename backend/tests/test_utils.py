@@ -0,0 +1,26 @@
+from converter.utils import NodeIdAllocator
+
+
+def test_first_allocation_keeps_the_base():
+    allocator = NodeIdAllocator()
+    assert allocator.allocate_id("HTTP") == "http"
+    assert allocator.allocate_name("HTTP") == "HTTP"
+
+
+def test_collisions_get_increasing_suffixes():
+    allocator = NodeIdAllocator()
+    assert [allocator.allocate_id("HTTP") for _ in range(3)] == ["http", "http-1", "http-2"]
+    assert [allocator.allocate_name("HTTP") for _ in range(3)] == ["HTTP", "HTTP1", "HTTP2"]
+
+
+def test_suffix_skips_values_taken_literally():
+    allocator = NodeIdAllocator()
+    assert allocator.allocate_name("HTTP1") == "HTTP1"
+    assert allocator.allocate_name("HTTP") == "HTTP"
+    assert allocator.allocate_name("HTTP") == "HTTP2"
+
+
+def test_ids_and_names_are_tracked_separately():
+    allocator = NodeIdAllocator()
+    allocator.allocate_id("loop")
+    assert allocator.allocate_name("loop") == "loop"
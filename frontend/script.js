@@ -5,6 +5,7 @@ document.addEventListener('DOMContentLoaded', () => {
     const dropArea = document.getElementById('drop-area');
     const fileInput = document.getElementById('fileInput');
     const uploadButton = document.getElementById('uploadButton');
+    const compactOutput = document.getElementById('compactOutput');
     const statusMessage = document.getElementById('status-message');
     const warningsContainer = document.getElementById('warnings-container');
     const downloadSection = document.getElementById('download-section');
@@ -247,6 +248,9 @@ document.addEventListener('DOMContentLoaded', () => {
 
         const formData = new FormData();
         formData.append('file', uploadedFile);
+        if (compactOutput.checked) {
+            formData.append('compact', '1');
+        }
 
         try {
             const response = await fetch(API_ENDPOINT, {
@@ -273,7 +277,7 @@ document.addEventListener('DOMContentLoaded', () => {
                     warningsContainer.innerHTML = '<h3>Warnings:</h3>';
                     result.warnings.forEach(warning => {
                         const p = document.createElement('p');
-                        p.textContent = `- ${warning}`;
+                        p.textContent = `- ${formatWarning(warning)}`;
                         warningsContainer.appendChild(p);
                     });
                 }
@@ -291,6 +295,26 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     });
 
+    // Warnings arrive as structured records, e.g.
+    // { kind: 'unmapped_module', module_type: 'x:Y', count: 2, modules: [3, 4] }
+    function formatWarning(warning) {
+        if (typeof warning === 'string') {
+            return warning;
+        }
+        const count = warning.count > 1 ? ` (${warning.count}x)` : '';
+        const modules = warning.modules ? ` [module IDs: ${warning.modules.join(', ')}]` : '';
+        switch (warning.kind) {
+            case 'unmapped_module':
+                return `Could not map Make.com module '${warning.module_type}'${count}. A placeholder node has been created.${modules}`;
+            case 'unconvertible_expression':
+                return `Could not convert expression {{${warning.expression}}} in '${warning.module_type}'${count}. See the 'Unconvertible Expressions' sticky note.`;
+            case 'truncated':
+                return `... and ${warning.count} more warnings.`;
+            default:
+                return JSON.stringify(warning);
+        }
+    }
+
     downloadButton.addEventListener('click', () => {
         if (convertedWorkflow) {
             downloadWorkflow();
@@ -321,7 +345,8 @@ document.addEventListener('DOMContentLoaded', () => {
 
     function downloadWorkflow() {
         const filename = `${convertedWorkflow.name.replace(/\s/g, '_') || 'converted_workflow'}.json`;
-        const blob = new Blob([JSON.stringify(convertedWorkflow, null, 2)], { type: 'application/json' });
+        const json = compactOutput.checked ? JSON.stringify(convertedWorkflow) : JSON.stringify(convertedWorkflow, null, 2);
+        const blob = new Blob([json], { type: 'application/json' });
         const url = URL.createObjectURL(blob);
         const a = document.createElement('a');
         a.href = url;